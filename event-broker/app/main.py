@@ -10,12 +10,19 @@ import sys
 import logging
 import os
 import json
+import random
 from pathlib import Path
-from app_config import load_config
+from app_config import load_config, get_config
 from app.services.ably_service import AblyEventSubscriber
 from app.services.strategy_executor import StrategyExecutor
 from app.services.scheduler_service import SchedulerService
 
+try:
+    import uvloop
+    loop_factory = uvloop.new_event_loop
+except ImportError:
+    loop_factory = None
+
 # Setup logging
 logging.basicConfig(
     level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO')),
@@ -44,7 +51,6 @@ class EventBrokerApp:
     """Main application class for the Event Broker Service"""
 
     def __init__(self):
-        from app_config import get_config
         self.config = get_config()
         self.strategy_executor = StrategyExecutor(logger=logger)
         self.ably_subscriber = AblyEventSubscriber(
@@ -57,6 +63,7 @@ class EventBrokerApp:
             logger=logger
         )
         self.running = False
+        self._stop_event = asyncio.Event()
         self.manual_event_file = self.config.service.manual_event_file_path
 
     async def start(self):
@@ -72,11 +79,11 @@ class EventBrokerApp:
 
             self.running = True
             logger.info("Event Broker Service started successfully")
-            # Start manual event file watcher and keep the service running
-            await asyncio.gather(
-                self._run_forever(),
-                self._watch_manual_events()
-            )
+            # Start manual event file watcher and keep the service running;
+            # the task group cancels the sibling if either task fails
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._run_forever())
+                tg.create_task(self._watch_manual_events())
 
         except Exception as e:
             logger.error(f"Failed to start Event Broker Service: {e}")
@@ -89,6 +96,7 @@ class EventBrokerApp:
 
         logger.info("Stopping Event Broker Service...")
         self.running = False
+        self._stop_event.set()
 
         try:
             # Stop scheduler service
@@ -108,8 +116,7 @@ class EventBrokerApp:
     async def _run_forever(self):
         """Keep the service running and handle graceful shutdown"""
         try:
-            while self.running:
-                await asyncio.sleep(self.config.service.heartbeat_interval_seconds)
+            await self._stop_event.wait()
         except asyncio.CancelledError:
             logger.info("Service shutdown requested")
             await self.stop()
@@ -117,15 +124,28 @@ class EventBrokerApp:
     async def _watch_manual_events(self):
         """Watch for manual event files and process them"""
         logger.info(f"Starting manual event file watcher: {self.manual_event_file}")
+        check_interval = self.config.service.manual_event_check_interval_seconds
+        error_delay = check_interval
 
         while self.running:
             try:
                 if os.path.exists(self.manual_event_file):
                     await self._process_manual_event()
-                await asyncio.sleep(self.config.service.manual_event_check_interval_seconds)
+                error_delay = check_interval
+                await self._sleep_unless_stopped(check_interval)
             except Exception as e:
                 logger.error(f"Error in manual event watcher: {e}")
-                await asyncio.sleep(self.config.service.error_recovery_delay_seconds)
+                # Exponential backoff with jitter, capped at the configured recovery delay
+                error_delay = min(error_delay * 2, self.config.service.error_recovery_delay_seconds)
+                await self._sleep_unless_stopped(error_delay * random.uniform(0.5, 1.0))
+
+    async def _sleep_unless_stopped(self, seconds: float):
+        """Sleep for up to `seconds`, waking immediately when the service stops"""
+        try:
+            async with asyncio.timeout(seconds):
+                await self._stop_event.wait()
+        except TimeoutError:
+            pass
 
     async def _process_manual_event(self):
         """Process a manual event file"""
@@ -195,11 +215,7 @@ class EventBrokerApp:
 
     def _find_account_by_id(self, account_id: str):
         """Find an account by ID across all strategies"""
-        for strategy_name, accounts in self.ably_subscriber.strategies.items():
-            for account in accounts:
-                if account.get('account_id') == account_id:
-                    return account
-        return None
+        return self.ably_subscriber.accounts_by_id.get(account_id)
 
     def _get_strategy_accounts(self, strategy_name: str):
         """Get accounts for a specific strategy from the Ably subscriber"""
@@ -266,7 +282,10 @@ async def main():
 if __name__ == "__main__":
     # Run the application
     try:
-        asyncio.run(main())
+        # Main process runs on uvloop when available; trading subprocesses keep
+        # their own default loops for ib_async
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         logger.info("Application terminated by user")
     except Exception as e:
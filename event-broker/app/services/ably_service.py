@@ -8,6 +8,11 @@ import logging
 from typing import Dict, List, Optional, Any
 from ably import AblyRealtime
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 class AblyEventSubscriber:
     """Subscribes to Ably channels and routes to strategy executor"""
 
@@ -15,6 +20,7 @@ class AblyEventSubscriber:
         self.logger = logger or logging.getLogger(__name__)
         self.strategy_executor = strategy_executor
         self.strategies = {}  # strategy_name -> List[accounts]
+        self.accounts_by_id = {}  # account_id -> account
         self.ably = None
         self.api_key = os.getenv('REALTIME_API_KEY')
 
@@ -43,7 +49,7 @@ class AblyEventSubscriber:
         try:
             accounts_file = '/app/accounts.yaml'
             with open(accounts_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
 
             trading_mode = os.getenv('TRADING_MODE', 'paper')
             self.logger.info(f"Loading accounts for trading mode: {trading_mode}")
@@ -53,10 +59,19 @@ class AblyEventSubscriber:
                     account.get('enabled', True) and
                     account.get('strategy_name')):
 
-                    strategy = account['strategy_name']
-                    if strategy not in self.strategies:
-                        self.strategies[strategy] = []
-                    self.strategies[strategy].append(account)
+                    self.strategies.setdefault(account['strategy_name'], []).append(account)
+
+            # Index in strategy order so lookups keep the precedence of a strategy-by-strategy scan
+            for strategy, accounts in self.strategies.items():
+                for account in accounts:
+                    account_id = account.get('account_id')
+                    if account_id in self.accounts_by_id:
+                        self.logger.warning(
+                            f"Duplicate account ID '{account_id}' in strategy '{strategy}'; "
+                            f"using the entry from strategy '{self.accounts_by_id[account_id]['strategy_name']}'"
+                        )
+                        continue
+                    self.accounts_by_id[account_id] = account
 
             total_accounts = sum(len(accounts) for accounts in self.strategies.values())
             self.logger.info(f"Loaded {len(self.strategies)} strategies with {total_accounts} accounts")
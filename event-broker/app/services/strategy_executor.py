@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Any
 from concurrent.futures import ProcessPoolExecutor
 from app_config import get_config
 from .notification_service import NotificationService
+from .trading_executor import execute_strategy_batch
 
 class StrategyExecutor:
     """Orchestrates parallel execution of strategy trading"""
@@ -35,7 +36,6 @@ class StrategyExecutor:
             self.logger.info(f"Starting strategy {strategy_name} execution for {len(accounts)} accounts")
 
             # Execute in subprocess for complete isolation
-            from .trading_executor import execute_strategy_batch
             result = await asyncio.get_event_loop().run_in_executor(
                 self.executor,
                 execute_strategy_batch,
@@ -106,31 +106,39 @@ class StrategyExecutor:
         timestamp = result.get('timestamp', datetime.now().isoformat())
         operation = result.get('event', 'unknown')
 
-        for account_result in result.get('results', []):
-            account_id = account_result.get('account_id')
-            success = account_result.get('success', False)
-            error = account_result.get('error')
-            details = account_result.get('details')
-
-            await self.notification_service.send_account_notification(
+        # Accounts are notified concurrently; each account's result and warnings stay in order
+        await asyncio.gather(*(
+            self._send_single_account_notifications(strategy_name, operation, timestamp, account_result)
+            for account_result in result.get('results', [])
+        ))
+
+    async def _send_single_account_notifications(self, strategy_name: str, operation: str,
+                                                 timestamp: str, account_result: dict):
+        """Send the result notification, then any warnings, for one account"""
+        account_id = account_result.get('account_id')
+        success = account_result.get('success', False)
+        error = account_result.get('error')
+        details = account_result.get('details')
+
+        await self.notification_service.send_account_notification(
+            account_id=account_id,
+            strategy_name=strategy_name,
+            operation=operation,
+            timestamp=timestamp,
+            success=success,
+            error=error,
+            details=details
+        )
+
+        # Send warnings if present
+        if details and details.get('warnings'):
+            await self.notification_service.send_warnings(
                 account_id=account_id,
                 strategy_name=strategy_name,
                 operation=operation,
-                timestamp=timestamp,
-                success=success,
-                error=error,
-                details=details
+                warnings=details.get('warnings')
             )
 
-            # Send warnings if present
-            if details and details.get('warnings'):
-                await self.notification_service.send_warnings(
-                    account_id=account_id,
-                    strategy_name=strategy_name,
-                    operation=operation,
-                    warnings=details.get('warnings')
-                )
-
     def cleanup(self):
         """Cleanup resources"""
         try:
@@ -6,9 +6,10 @@ import asyncio
 import signal
 import atexit
 import logging
+import aiohttp
 from datetime import datetime
-from typing import List
-from contextlib import asynccontextmanager
+from typing import List, Optional
+from contextlib import asynccontextmanager, contextmanager
 from app.models import AccountConfig, AccountExecutionResult, StrategyExecutionResult
 from app.services.pdt_protection_service import PDTProtectionService
 from app.services.scheduler_service import add_account_to_schedule
@@ -55,17 +56,19 @@ def extract_client_id_from_account(account_id: str) -> int:
 async def process_strategy_accounts(strategy_name: str, accounts: List[dict], event_data: dict) -> StrategyExecutionResult:
     """Process all accounts for a strategy in parallel"""
 
-    tasks = []
-    for account in accounts:
-        # Extract unique client ID from account ID (e.g., 'U21240574' -> 21240574)
-        # This ensures no collisions even when multiple strategies run in parallel
-        client_id = extract_client_id_from_account(account['account_id'])
+    # One HTTP session per batch so accounts share keep-alive connections to the allocations API
+    async with aiohttp.ClientSession() as http_session:
+        tasks = []
+        for account in accounts:
+            # Extract unique client ID from account ID (e.g., 'U21240574' -> 21240574)
+            # This ensures no collisions even when multiple strategies run in parallel
+            client_id = extract_client_id_from_account(account['account_id'])
 
-        task = process_single_account(account, client_id, event_data)
-        tasks.append(task)
+            task = process_single_account(account, client_id, event_data, http_session)
+            tasks.append(task)
 
-    # Execute all accounts in parallel
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all accounts in parallel
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Format results using Pydantic models
     return StrategyExecutionResult(
@@ -84,28 +87,28 @@ async def process_strategy_accounts(strategy_name: str, accounts: List[dict], ev
         ]
     )
 
-async def process_single_account(account: dict, client_id: int, event_data: dict):
+async def process_single_account(account: dict, client_id: int, event_data: dict,
+                                 http_session: aiohttp.ClientSession):
     """Process a single account with dedicated IBKR client"""
-    account_config = AccountConfig(**account)
+    account_config = AccountConfig.model_validate(account)
     account_id = account_config.account_id
     strategy_name = account_config.strategy_name
 
-    async with account_logger_context(account_id, strategy_name) as logger:
+    with account_logger_context(account_id, strategy_name) as logger:
+        # Resolve the command handler before doing any broker work
+        exec_command = event_data.get('exec')
+        execute_command = _COMMAND_HANDLERS.get(exec_command)
+        if execute_command is None:
+            raise ValueError(f"Unknown command: {exec_command}")
+
         # Check PDT protection before execution
         await _check_pdt_protection(account_config, event_data, logger)
 
         # Execute trading operation
-        manager = SubprocessManager()
+        manager = _get_subprocess_manager()
         async with manager.managed_broker_client(account_config, client_id, logger) as broker_client:
-            rebalancer = _create_rebalancer(account_config, broker_client, logger)
-            
-            exec_command = event_data.get('exec')
-            if exec_command == 'rebalance':
-                return await _execute_live_rebalance(rebalancer, account_config, logger)
-            elif exec_command == 'print-rebalance':
-                return await _execute_preview_rebalance(rebalancer, account_config, logger)
-            else:
-                raise ValueError(f"Unknown command: {exec_command}")
+            rebalancer = _create_rebalancer(account_config, broker_client, logger, http_session)
+            return await execute_command(rebalancer, account_config, logger)
 
 async def _check_pdt_protection(account_config: AccountConfig, event_data: dict, logger):
     """Check PDT protection rules before execution"""
@@ -136,11 +139,13 @@ async def _check_pdt_protection(account_config: AccountConfig, event_data: dict,
         logger.warning(error_msg)
         raise Exception(error_msg)
 
-def _create_rebalancer(account_config: AccountConfig, broker_client, logger):
+def _create_rebalancer(account_config: AccountConfig, broker_client, logger,
+                       http_session: aiohttp.ClientSession):
     """Create appropriate rebalancer based on broker type"""
     if account_config.broker.lower() == 'ibkr':
+        # Imported lazily so only rebalance subprocesses load ib_async
         from ibkr_connector import IBKRRebalancer
-        return IBKRRebalancer(broker_client, logger=logger)
+        return IBKRRebalancer(broker_client, logger=logger, http_session=http_session)
     else:
         raise ValueError(f"Unsupported broker: {account_config.broker}")
 
@@ -190,6 +195,12 @@ async def _execute_preview_rebalance(rebalancer, account_config: AccountConfig,
         'warnings': result.warnings
     }
 
+# exec command -> handler(rebalancer, account_config, logger)
+_COMMAND_HANDLERS = {
+    'rebalance': _execute_live_rebalance,
+    'print-rebalance': _execute_preview_rebalance,
+}
+
 def _log_proposed_trades(proposed_trades: list, logger):
     """Log proposed trades in a readable format"""
     logger.info("=== PROPOSED TRADES ===")
@@ -200,8 +211,8 @@ def _log_proposed_trades(proposed_trades: list, logger):
 
 # Account-Level Logging Architecture
 
-@asynccontextmanager
-async def account_logger_context(account_id: str, strategy_name: str):
+@contextmanager
+def account_logger_context(account_id: str, strategy_name: str):
     """Create a logger context with account-specific formatting"""
 
     # Create account-specific logger
@@ -250,7 +261,7 @@ class SubprocessManager:
         account_id = account_config.account_id
 
         try:
-            sys.path.append('/app')  # Only for app.* imports
+            # Imported lazily so only rebalance subprocesses load broker connectors
             from app.trading.broker_factory import create_broker_client
 
             logger.info(f"Creating broker client with ID {client_id}")
@@ -308,4 +319,14 @@ class SubprocessManager:
         """Handle termination signals"""
         print(f"Received signal {signum}, initiating cleanup...")
         self._cleanup_all()
-        sys.exit(0)
\ No newline at end of file
+        sys.exit(0)
+
+# One manager per worker process so cleanup hooks are registered only once
+_subprocess_manager: Optional[SubprocessManager] = None
+
+def _get_subprocess_manager() -> SubprocessManager:
+    """Get the process-wide SubprocessManager, creating it on first use"""
+    global _subprocess_manager
+    if _subprocess_manager is None:
+        _subprocess_manager = SubprocessManager()
+    return _subprocess_manager
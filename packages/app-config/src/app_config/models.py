@@ -136,7 +136,7 @@ class TradingConfig(BaseModel):
         default=2.0,
         ge=0.5,
         le=10.0,
-        description="Delay between order status checks in wait loop"
+        description="Maximum delay between order status checks if no status update arrives"
     )
     post_completion_delay_seconds: float = Field(
         default=1.0,
@@ -201,12 +201,6 @@ class PDTProtectionConfig(BaseModel):
 class ServiceConfig(BaseModel):
     """Service configuration."""
 
-    heartbeat_interval_seconds: float = Field(
-        default=1.0,
-        ge=0.1,
-        le=10.0,
-        description="Service heartbeat interval"
-    )
     manual_event_check_interval_seconds: float = Field(
         default=1.0,
         ge=0.1,
@@ -217,7 +211,7 @@ class ServiceConfig(BaseModel):
         default=5.0,
         ge=1.0,
         le=60.0,
-        description="Wait time after error in manual event watcher"
+        description="Maximum backoff after repeated errors in manual event watcher"
     )
     manual_event_file_path: str = Field(
         default="/app/data/manual-rebalance/rebalance.json",
@@ -4,18 +4,26 @@ import os
 import json
 import aiohttp
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from broker_connector_base import AllocationItem, AccountConfig
 from app_config import get_config
 
+# Last parsed response per allocations URL as (etag, allocations). Executor worker
+# processes are long-lived, so this lets later batches revalidate with If-None-Match.
+_allocations_cache: Dict[str, Tuple[str, List[AllocationItem]]] = {}
+
 class AllocationService:
     """Service for fetching target allocations from the API"""
 
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.config = get_config()
         self.logger = logger or logging.getLogger(__name__)
         self.base_url = os.getenv('ALLOCATIONS_BASE_URL', 'https://fintech.zehnlabs.com/api')
         self.api_key = os.getenv('ALLOCATIONS_API_KEY')
+        self.headers = {'x-api-key': self.api_key} if self.api_key else {}
+        # Optional caller-owned session so keep-alive connections are reused across fetches
+        self.session = session
 
     async def get_allocations(self, account_config: AccountConfig) -> List[AllocationItem]:
         """Fetch target allocations for a strategy"""
@@ -23,49 +31,67 @@ class AllocationService:
         strategy_name = account_config.strategy_name
         allocations_url = f"{self.base_url}/{strategy_name}/allocations"
 
-        headers = {}
-        if self.api_key:
-            headers['x-api-key'] = self.api_key
-
         self.logger.debug(f"Retrieving allocations from {allocations_url}")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    allocations_url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.config.api.allocation_timeout_seconds)
-                ) as response:
-
-                    if response.status != 200:
-                        response_text = await response.text()
-                        raise Exception(f"API returned status {response.status}: {response_text}")
-
-                    data = await response.json()
-
-                    if not isinstance(data, dict):
-                        raise ValueError("API response must be a JSON object")
+            if self.session is not None:
+                return await self._fetch_allocations(self.session, allocations_url, strategy_name)
 
-                    if data.get("status") != "success":
-                        raise ValueError(f"API returned error status: {data.get('status', 'unknown')}")
-
-                    response_data = data.get("data", {})
-                    allocations_list = response_data.get("allocations", [])
-
-                    if not isinstance(allocations_list, list):
-                        raise ValueError("Allocations must be a list")
-
-                    allocations = [
-                        AllocationItem(
-                            symbol=item.get('ticker', item.get('symbol')),
-                            allocation=float(item.get('allocation', 0))
-                        )
-                        for item in allocations_list
-                    ]
-
-                    self.logger.info(f"Retrieved {len(allocations)} allocations for {strategy_name}")
-                    return allocations
+            async with aiohttp.ClientSession() as session:
+                return await self._fetch_allocations(session, allocations_url, strategy_name)
 
         except Exception as e:
             self.logger.error(f"Failed to get allocations: {e}")
             raise
+
+    async def _fetch_allocations(self, session: aiohttp.ClientSession, allocations_url: str,
+                                 strategy_name: str) -> List[AllocationItem]:
+        """Request and parse allocations using the given session"""
+        cached = _allocations_cache.get(allocations_url)
+        headers = {**self.headers, 'If-None-Match': cached[0]} if cached else self.headers
+
+        async with session.get(
+            allocations_url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.config.api.allocation_timeout_seconds)
+        ) as response:
+
+            if response.status == 304 and cached:
+                self.logger.info(f"Allocations for {strategy_name} not modified, reusing {len(cached[1])} cached allocations")
+                return list(cached[1])
+
+            if response.status != 200:
+                response_text = await response.text()
+                raise Exception(f"API returned status {response.status}: {response_text}")
+
+            data = await response.json()
+
+            if not isinstance(data, dict):
+                raise ValueError("API response must be a JSON object")
+
+            if data.get("status") != "success":
+                raise ValueError(f"API returned error status: {data.get('status', 'unknown')}")
+
+            response_data = data.get("data", {})
+            allocations_list = response_data.get("allocations", [])
+
+            if not isinstance(allocations_list, list):
+                raise ValueError("Allocations must be a list")
+
+            try:
+                allocations = [
+                    AllocationItem(
+                        symbol=item.get('ticker') or item.get('symbol'),
+                        allocation=float(item.get('allocation', 0))
+                    )
+                    for item in allocations_list
+                ]
+            except (AttributeError, TypeError, ValueError) as e:
+                raise ValueError(f"Each allocation must be an object with a symbol and numeric allocation: {e}") from e
+
+            etag = response.headers.get('ETag')
+            if etag:
+                _allocations_cache[allocations_url] = (etag, allocations)
+
+            self.logger.info(f"Retrieved {len(allocations)} allocations for {strategy_name}")
+            return list(allocations)
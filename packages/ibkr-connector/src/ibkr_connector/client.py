@@ -41,11 +41,14 @@ class IBKRClient(BrokerClient):
         self._price_cache: Dict[str, CachedPrice] = {}
         self._cache_ttl_seconds = self.config.ibkr.price_cache_ttl_seconds
 
+        # Qualified contract cache: symbol -> Contract (conIds don't change, so no TTL)
+        self._contract_cache: Dict[str, Contract] = {}
+
         # Automatically determine port based on trading mode
         self.port = self._determine_port()
 
         # Log package version
-        self.logger.info(
+        self.logger.debug(
             f"Initializing IBKRClient with broker-connector-base v{broker_connector_base.__version__}"
         )
 
@@ -53,25 +56,24 @@ class IBKRClient(BrokerClient):
         """Determine the correct IBKR Gateway port based on trading mode"""
         trading_mode = os.getenv('TRADING_MODE', 'paper').lower()
 
-        # Debug logging
-        self.logger.info(f"TRADING_MODE detected: '{trading_mode}'")
+        self.logger.debug(f"TRADING_MODE detected: '{trading_mode}'")
 
         # Allow manual override via IB_PORT if explicitly set
         manual_port = os.getenv('IB_PORT')
-        self.logger.info(f"IB_PORT environment variable: {manual_port}")
+        self.logger.debug(f"IB_PORT environment variable: {manual_port}")
 
         if manual_port:
             port = int(manual_port)
-            self.logger.info(f"Using manually configured IB_PORT: {port}")
+            self.logger.debug(f"Using manually configured IB_PORT: {port}")
             return port
 
         # Automatic port determination based on trading mode
         if trading_mode == 'live':
             port = self.config.ibkr.ports.live_internal
-            self.logger.info(f"Auto-detected port {port} for LIVE trading mode")
+            self.logger.debug(f"Auto-detected port {port} for LIVE trading mode")
         else:
             port = self.config.ibkr.ports.paper_internal
-            self.logger.info(f"Auto-detected port {port} for PAPER trading mode")
+            self.logger.debug(f"Auto-detected port {port} for PAPER trading mode")
 
         return port
 
@@ -128,22 +130,20 @@ class IBKRClient(BrokerClient):
                               This avoids rate limiting when requesting the same symbols repeatedly.
         """
         try:
-            all_positions = self.ib.positions()
-            account_positions = [p for p in all_positions if p.account == account_id]
+            # positions(account) reads only this account's entries instead of scanning all accounts;
+            # closed (zero-share) positions are dropped up front so later passes only see open ones
+            account_positions = [p for p in self.ib.positions(account_id) if p.position != 0]
 
-            self.logger.info(f"Found {len(account_positions)} positions for account {account_id}")
+            self.logger.info(f"Found {len(account_positions)} open positions for account {account_id}")
 
             # Get market prices for all positions
-            symbols = [pos.contract.symbol for pos in account_positions if pos.position != 0]
+            symbols = [pos.contract.symbol for pos in account_positions]
             market_prices_list = await self.get_multiple_market_prices(symbols, use_cache=use_cached_prices)
             market_prices_map = {mp.symbol: mp for mp in market_prices_list}
 
             # Build positions list with market prices
             positions = []
             for pos in account_positions:
-                if pos.position == 0:
-                    continue  # Skip zero positions
-
                 symbol = pos.contract.symbol
                 price_data = market_prices_map.get(symbol)
 
@@ -203,6 +203,8 @@ class IBKRClient(BrokerClient):
             use_cache: If True, returns cached prices (within TTL) when available.
                       Symbols not in cache will still be fetched from IBKR.
         """
+        # Duplicate symbols would otherwise be qualified and requested more than once
+        symbols = list(dict.fromkeys(symbols))
         prices = []
         symbols_to_fetch = []
         now = datetime.now()
@@ -216,13 +218,13 @@ class IBKRClient(BrokerClient):
                     if age_seconds <= self._cache_ttl_seconds:
                         # Cache hit - use cached price
                         prices.append(cached_entry.price)
-                        self.logger.debug(f"Using cached price for {symbol} (age: {age_seconds:.1f}s)")
+                        self.logger.debug("Using cached price for %s (age: %.1fs)", symbol, age_seconds)
                         continue
                 # Cache miss or expired - need to fetch
                 symbols_to_fetch.append(symbol)
         else:
             # Not using cache - fetch all symbols
-            symbols_to_fetch = list(symbols)  # Make a copy to avoid modifying original
+            symbols_to_fetch = symbols
 
         # If all prices were in cache, return immediately
         if not symbols_to_fetch:
@@ -258,20 +260,33 @@ class IBKRClient(BrokerClient):
         Raises:
             ValueError if any contracts fail to qualify
         """
-        contracts = [Stock(symbol, 'SMART', 'USD') for symbol in symbols]
         symbol_to_contract = {}
         failed_to_qualify = []
+        contracts = []
 
-        for contract in contracts:
-            try:
-                qualified = await self.ib.qualifyContractsAsync(contract)
-                if qualified:
-                    qualified_contract = qualified[0]
-                    symbol_to_contract[qualified_contract.symbol] = qualified_contract
-                else:
-                    failed_to_qualify.append(contract.symbol)
-            except Exception as e:
-                self.logger.debug(f"Failed to qualify contract for {contract.symbol}: {e}")
+        for symbol in symbols:
+            cached_contract = self._contract_cache.get(symbol)
+            if cached_contract is not None:
+                symbol_to_contract[cached_contract.symbol] = cached_contract
+            else:
+                contracts.append(Stock(symbol, 'SMART', 'USD'))
+
+        # Qualify uncached contracts concurrently; one request per contract keeps
+        # failures attributable to their symbol
+        results = await asyncio.gather(
+            *(self.ib.qualifyContractsAsync(contract) for contract in contracts),
+            return_exceptions=True
+        )
+
+        for contract, qualified in zip(contracts, results):
+            if isinstance(qualified, BaseException):
+                self.logger.debug("Failed to qualify contract for %s: %s", contract.symbol, qualified)
+                failed_to_qualify.append(contract.symbol)
+            elif qualified:
+                qualified_contract = qualified[0]
+                symbol_to_contract[qualified_contract.symbol] = qualified_contract
+                self._contract_cache[contract.symbol] = qualified_contract
+            else:
                 failed_to_qualify.append(contract.symbol)
 
         if not symbol_to_contract:
@@ -298,6 +313,7 @@ class IBKRClient(BrokerClient):
         """
         retry_delay = self.config.ibkr.market_data_retry_delay_seconds
         max_retries = self.config.ibkr.market_data_max_retries
+        synthetic_ask_offset = self.config.ibkr.synthetic_ask_offset_usd
 
         # Track which symbols still need valid prices
         pending_symbols = set(symbol_to_contract.keys())
@@ -334,8 +350,8 @@ class IBKRClient(BrokerClient):
                 ask_price = ticker.ask
                 if ask_price is None or ask_price <= 0 or math.isnan(ask_price):
                     # Market is closed - synthesize ask price
-                    synthetic_ask = ticker.bid + self.config.ibkr.synthetic_ask_offset_usd
-                    self.logger.warning(f"Market closed for {symbol} (ask={ticker.ask}). Using synthetic ask price: ${synthetic_ask:.2f} (bid + ${self.config.ibkr.synthetic_ask_offset_usd})")
+                    synthetic_ask = ticker.bid + synthetic_ask_offset
+                    self.logger.warning(f"Market closed for {symbol} (ask={ticker.ask}). Using synthetic ask price: ${synthetic_ask:.2f} (bid + ${synthetic_ask_offset})")
                     ask_price = synthetic_ask
 
                 # Extract valid prices (bid/ask are guaranteed valid at this point)
@@ -375,18 +391,20 @@ class IBKRClient(BrokerClient):
     async def place_order(self, account_id: str, symbol: str, quantity: int, order_type: str = 'MARKET', price: float = None) -> OrderResult:
         """Place an order"""
         try:
-            # Create contract
-            contract = Stock(symbol, 'SMART', 'USD')
-            qualified = await self.ib.qualifyContractsAsync(contract)
+            # Reuse the contract qualified for pricing when available
+            contract = self._contract_cache.get(symbol)
+            if contract is None:
+                qualified = await self.ib.qualifyContractsAsync(Stock(symbol, 'SMART', 'USD'))
 
-            if not qualified:
-                raise ValueError(f"Could not qualify contract for {symbol}")
+                if not qualified:
+                    raise ValueError(f"Could not qualify contract for {symbol}")
 
-            contract = qualified[0]
+                contract = self._contract_cache[symbol] = qualified[0]
 
             # Create order based on type
             action = 'BUY' if quantity > 0 else 'SELL'
-            if order_type == 'LIMIT' and price is not None:
+            is_limit = order_type == 'LIMIT' and price is not None
+            if is_limit:
                 order = LimitOrder(action, abs(quantity), price)
             else:
                 order = MarketOrder(action, abs(quantity))
@@ -400,7 +418,7 @@ class IBKRClient(BrokerClient):
             await asyncio.sleep(self.config.ibkr.order_placement_delay_seconds)  # Allow order to be processed
 
             order_desc = f"{order.action} {order.totalQuantity} {symbol}"
-            if order_type == 'LIMIT':
+            if is_limit:
                 order_desc += f" @ ${price}"
             self.logger.info(f"Placed order: {order_desc}")
 
@@ -459,6 +477,22 @@ class IBKRClient(BrokerClient):
         except Exception as e:
             self.logger.error(f"Failed to cancel order {order_id}: {e}")
 
+    async def wait_for_order_update(self, timeout: float):
+        """Wait until any order status changes or the timeout elapses"""
+        updated = asyncio.Event()
+
+        def on_order_status(trade):
+            updated.set()
+
+        self.ib.orderStatusEvent += on_order_status
+        try:
+            async with asyncio.timeout(timeout):
+                await updated.wait()
+        except TimeoutError:
+            pass
+        finally:
+            self.ib.orderStatusEvent -= on_order_status
+
     async def get_order_status(self, order_id: str) -> str:
         """Get status of an order (order_id is string)"""
         try:
@@ -1,8 +1,9 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 from datetime import datetime
 from broker_connector_base import ContractPrice
 
-class CachedPrice(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CachedPrice:
     """Cached price data with timestamp for TTL validation"""
     price: ContractPrice
     cached_at: datetime
@@ -1,8 +1,10 @@
 """Simplified rebalancer without account locking"""
 
+import asyncio
+import time
 from typing import List, Optional
-from datetime import datetime
 import logging
+import aiohttp
 
 try:
     from broker_connector_base import (
@@ -28,10 +30,12 @@ except ImportError as e:
 class IBKRRebalancer(BaseRebalancer):
     """Simplified rebalancer without account locking"""
 
-    def __init__(self, broker_client, logger: Optional[logging.Logger] = None):
+    def __init__(self, broker_client, logger: Optional[logging.Logger] = None,
+                 http_session: Optional[aiohttp.ClientSession] = None):
         self.config = get_config()
         super().__init__(broker_client, logger)
         self.ibkr = broker_client  # Keep self.ibkr for compatibility
+        self.allocation_service = AllocationService(logger=self.logger, session=http_session)
 
     async def rebalance_account(self, account: AccountConfig) -> RebalanceResult:
         """Execute rebalancing for account"""
@@ -44,10 +48,11 @@ class IBKRRebalancer(BaseRebalancer):
             snapshot = await self.ibkr.get_account_snapshot(account_id)
             self._log_account_snapshot("INITIAL", snapshot)
 
-            # Get market prices for all symbols
+            # Get market prices for all symbols; held positions were just priced by the
+            # snapshot, so only target-only symbols are requested from IBKR
             all_symbols = list(set([a.symbol for a in allocations] +
                                   [p.symbol for p in snapshot.positions]))
-            market_prices = await self.ibkr.get_multiple_market_prices(all_symbols)
+            market_prices = await self.ibkr.get_multiple_market_prices(all_symbols, use_cache=True)
 
             # Calculate and execute sell orders
             calculator = TradeCalculator(logger=self.logger)
@@ -64,8 +69,10 @@ class IBKRRebalancer(BaseRebalancer):
 
             sell_orders = await self._execute_sell_orders(account_id, result.trades)
 
-            # Recalculate and execute buy orders with updated cash balance
-            snapshot = await self.ibkr.get_account_snapshot(account_id, use_cached_prices=True)
+            # Recalculate and execute buy orders with updated cash balance; the
+            # account is unchanged if nothing was sold
+            if sell_orders:
+                snapshot = await self.ibkr.get_account_snapshot(account_id, use_cached_prices=True)
             self.logger.info(f"Cash balance after sells: ${snapshot.cash_balance:,.2f}")
 
             buy_result = calculator.calculate_trades(
@@ -86,7 +93,10 @@ class IBKRRebalancer(BaseRebalancer):
             )
 
             # Get final snapshot and return results
-            final_snapshot = await self.ibkr.get_account_snapshot(account_id, use_cached_prices=True)
+            if orders_to_execute:
+                final_snapshot = await self.ibkr.get_account_snapshot(account_id, use_cached_prices=True)
+            else:
+                final_snapshot = snapshot
             self._log_account_snapshot("FINAL", final_snapshot)
 
             self.logger.info(f"Rebalance completed successfully for account {account_id}")
@@ -110,8 +120,7 @@ class IBKRRebalancer(BaseRebalancer):
 
     async def _get_target_allocations(self, account: AccountConfig) -> List[AllocationItem]:
         """Get and process target allocations for account"""
-        allocation_service = AllocationService(logger=self.logger)
-        allocations = await allocation_service.get_allocations(account)
+        allocations = await self.allocation_service.get_allocations(account)
 
         if account.replacement_set:
             replacement_service = ReplacementService(logger=self.logger)
@@ -131,17 +140,8 @@ class IBKRRebalancer(BaseRebalancer):
             return []
 
         self.logger.info(f"Executing {len(sell_orders)} sell orders")
-        
-        for trade in sell_orders:
-            order_result = await self.ibkr.place_order(
-                account_id=account_id,
-                symbol=trade.symbol,
-                quantity=trade.quantity,
-                order_type=trade.order_type,
-                price=trade.price
-            )
-            trade.order_id = order_result.order_id
 
+        await self._place_orders(account_id, sell_orders)
         await self._wait_for_orders_complete(sell_orders)
         return sell_orders
 
@@ -171,20 +171,48 @@ class IBKRRebalancer(BaseRebalancer):
         self._generate_skipped_order_warnings(skipped_trades, warnings)
 
         # Execute affordable orders
-        for trade in orders_to_execute:
-            order_result = await self.ibkr.place_order(
+        if orders_to_execute:
+            await self._place_orders(account_id, orders_to_execute)
+            await self._wait_for_orders_complete(orders_to_execute)
+
+        return orders_to_execute
+
+    async def _place_orders(self, account_id: str, trades: List[Trade]):
+        """Place orders concurrently and record their order IDs on the trades"""
+        # Contracts are already qualified during pricing, so orders still go out in
+        # priority order; only the post-placement settle delays overlap
+        order_results = await asyncio.gather(*(
+            self.ibkr.place_order(
                 account_id=account_id,
                 symbol=trade.symbol,
                 quantity=trade.quantity,
                 order_type=trade.order_type,
                 price=trade.price
             )
-            trade.order_id = order_result.order_id
-
-        if orders_to_execute:
-            await self._wait_for_orders_complete(orders_to_execute)
-
-        return orders_to_execute
+            for trade in trades
+        ), return_exceptions=True)
+
+        placed_trades = []
+        errors = []
+        for trade, order_result in zip(trades, order_results):
+            if isinstance(order_result, BaseException):
+                errors.append(order_result)
+            else:
+                trade.order_id = order_result.order_id
+                placed_trades.append(trade)
+
+        if errors:
+            # Sibling placements already reached IBKR; track them to completion before failing
+            if placed_trades:
+                self.logger.error(
+                    f"{len(errors)} of {len(trades)} orders failed to place; "
+                    f"waiting for {len(placed_trades)} placed orders before aborting"
+                )
+                try:
+                    await self._wait_for_orders_complete(placed_trades)
+                except Exception as e:
+                    self.logger.error(f"Placed orders did not complete cleanly: {e}")
+            raise errors[0]
 
     def _calculate_available_cash(self, cash_balance: float) -> float:
         """Calculate available cash for buy orders"""
@@ -272,25 +300,16 @@ class IBKRRebalancer(BaseRebalancer):
         account_id = account.account_id
         self.logger.info(f"Calculating rebalance for account {account_id}")
 
-        allocation_service = AllocationService(logger=self.logger)
-        allocations = await allocation_service.get_allocations(account)
-
-        if account.replacement_set:
-            replacement_service = ReplacementService(logger=self.logger)
-            allocations = replacement_service.apply_replacements_with_scaling(
-                allocations=allocations,
-                replacement_set_name=account.replacement_set
-            )
-
-        self._log_target_allocations(allocations)
+        allocations = await self._get_target_allocations(account)
 
         snapshot = await self.ibkr.get_account_snapshot(account_id)
 
         self._log_account_snapshot("CURRENT", snapshot)
 
+        # Held positions were just priced by the snapshot; reuse those prices
         all_symbols = list(set([a.symbol for a in allocations] +
                               [p.symbol for p in snapshot.positions]))
-        market_prices = await self.ibkr.get_multiple_market_prices(all_symbols)
+        market_prices = await self.ibkr.get_multiple_market_prices(all_symbols, use_cache=True)
 
         calculator = TradeCalculator(logger=self.logger)
         result = calculator.calculate_trades(
@@ -321,32 +340,34 @@ class IBKRRebalancer(BaseRebalancer):
 
     async def _wait_for_orders_complete(self, orders: List[Trade], timeout: Optional[int] = None):
         """Wait for orders to complete or fail"""
-        import asyncio
-
         if not orders:
             return
 
         if timeout is None:
             timeout = self.config.trading.order_timeout_seconds
+        check_interval = self.config.trading.order_status_check_interval_seconds
 
         # TWS API terminal states (DoneStates)
         TERMINAL_STATES = ['FILLED', 'CANCELLED', 'APICANCELLED', 'INACTIVE']
         FAILED_STATES = ['CANCELLED', 'APICANCELLED', 'INACTIVE']
 
         self.logger.info(f"Waiting for {len(orders)} orders to complete")
-        start_time = datetime.now()
+        deadline = time.monotonic() + timeout
         failed_orders = []
 
-        while (datetime.now() - start_time).total_seconds() < timeout:
+        while time.monotonic() < deadline:
             all_complete = True
             failed_orders = []
 
             for order in orders:
                 status = await self.ibkr.get_order_status(order.order_id)
-                self.logger.debug(f"Order {order.order_id} ({order.symbol} x{order.quantity}) status: '{status}'")
+                self.logger.debug("Order %s (%s x%s) status: '%s'", order.order_id, order.symbol, order.quantity, status)
 
                 if status and status.upper() not in TERMINAL_STATES:
+                    # Failures are only reported once every order is done, so one
+                    # pending order settles this check
                     all_complete = False
+                    break
                 elif status and status.upper() in FAILED_STATES:
                     failed_orders.append(order)
 
@@ -361,7 +382,8 @@ class IBKRRebalancer(BaseRebalancer):
                     await asyncio.sleep(self.config.trading.post_completion_delay_seconds)
                     return
 
-            await asyncio.sleep(self.config.trading.order_status_check_interval_seconds)
+            # Re-check as soon as IBKR reports a status change; the interval is only a fallback
+            await self.ibkr.wait_for_order_update(check_interval)
 
         self.logger.error(f"CRITICAL: Orders timed out after {timeout} seconds")
         raise Exception(f"Order execution timeout after {timeout} seconds")
@@ -7,13 +7,32 @@ while maintaining equivalent exposure through scaling factors.
 import os
 import yaml
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from broker_connector_base import AllocationItem
 from app_config import get_config
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-@dataclass
+# Parsed replacement-sets.yaml shared by all instances in the process: (mtime, data)
+_replacement_sets_cache: Optional[Tuple[float, dict]] = None
+
+
+def _read_replacement_sets(path: str) -> Optional[dict]:
+    """Parse replacement-sets.yaml, reusing the cached result while the file is unchanged"""
+    global _replacement_sets_cache
+
+    mtime = os.path.getmtime(path)
+    if _replacement_sets_cache is None or _replacement_sets_cache[0] != mtime:
+        with open(path, 'r') as f:
+            _replacement_sets_cache = (mtime, yaml.load(f, Loader=SafeLoader))
+    return _replacement_sets_cache[1]
+
+
+@dataclass(slots=True, frozen=True)
 class ReplacementRule:
     """ETF replacement rule with scaling factor"""
     source: str      # Original ETF symbol (e.g., "UVXY")
@@ -38,8 +57,7 @@ class ReplacementService:
                 self.logger.warning(f"replacement-sets.yaml not found at {replacement_sets_path}")
                 return
 
-            with open(replacement_sets_path, 'r') as f:
-                replacement_sets_data = yaml.safe_load(f)
+            replacement_sets_data = _read_replacement_sets(replacement_sets_path)
 
             if not replacement_sets_data:
                 self.logger.info("replacement-sets.yaml is empty")
@@ -109,7 +127,7 @@ class ReplacementService:
                 total_excess += excess
                 replaced_symbols.add(rule.target)
 
-                self.logger.debug(f"Replaced {symbol} -> {rule.target}: {old_allocation_percent:.3f} -> {new_allocation_percent:.3f} (scale: {rule.scale})")
+                self.logger.debug("Replaced %s -> %s: %.3f -> %.3f (scale: %s)", symbol, rule.target, old_allocation_percent, new_allocation_percent, rule.scale)
             else:
                 modified_allocations.append({
                     'symbol': symbol,
@@ -145,7 +163,7 @@ class ReplacementService:
                             'symbol': allocation['symbol'],
                             'allocation': new_allocation
                         })
-                        self.logger.debug(f"Scaled down {allocation['symbol']}: {old_allocation:.3f} -> {new_allocation:.3f}")
+                        self.logger.debug("Scaled down %s: %.3f -> %.3f", allocation['symbol'], old_allocation, new_allocation)
                     else:
                         # Keep replaced allocations as-is
                         final_allocations.append(allocation)
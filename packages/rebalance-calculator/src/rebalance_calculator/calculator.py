@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 import logging
-import math
+from operator import attrgetter
 from broker_connector_base import AccountSnapshot, ContractPrice, Trade, AllocationItem, AccountConfig
 from app_config import get_config
 from .models import TradeCalculationResult
@@ -13,6 +13,8 @@ class TradeCalculator:
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.config = get_config()
+        # Derived from config once instead of per trade
+        self._buy_slippage_multiplier = self.config.trading.buy_slippage_multiplier
 
     def calculate_trades(self, snapshot: AccountSnapshot, allocations: List[AllocationItem],
                         market_prices: List[ContractPrice], account_config: AccountConfig,
@@ -21,7 +23,6 @@ class TradeCalculator:
         Calculate required trades based on target allocations.
         Returns TradeCalculationResult containing trades and warnings
         """
-        trades = []
         warnings = []
         total_value = snapshot.total_value
         cash_reserve = account_config.cash_reserve_percent / 100.0
@@ -41,7 +42,6 @@ class TradeCalculator:
             phase=phase,
             warnings=warnings
         )
-        trades.extend(liquidation_trades)
 
         # Calculate rebalancing trades for target allocations
         rebalance_trades = self._calculate_rebalance_trades(
@@ -52,10 +52,9 @@ class TradeCalculator:
             price_map=price_map,
             phase=phase
         )
-        trades.extend(rebalance_trades)
 
-        # Sort and scale trades
-        trades = self._sort_trades_by_priority(trades, allocations)
+        # Sort and scale trades (single concatenation sized to the final trade count)
+        trades = self._sort_trades_by_priority(liquidation_trades + rebalance_trades, allocations)
 
         if phase in ['buy', 'all']:
             trades = self._apply_cash_constraint_scaling(
@@ -70,6 +69,10 @@ class TradeCalculator:
     def _calculate_liquidation_trades(self, snapshot: AccountSnapshot, allocations: List[AllocationItem],
                                      price_map: dict, phase: str, warnings: List[str]) -> List[Trade]:
         """Calculate trades to liquidate positions not in target allocations"""
+        # Fresh accounts have nothing to liquidate
+        if not snapshot.positions:
+            return []
+
         trades = []
         target_symbols = {alloc.symbol for alloc in allocations}
 
@@ -82,7 +85,7 @@ class TradeCalculator:
                     self.logger.error(f"No price data for {position.symbol} to liquidate")
                     raise ValueError(f"No price data for {position.symbol}. Cannot liquidate position without valid price.")
 
-                if not price_data.bid or price_data.bid <= 0 or math.isnan(price_data.bid):
+                if not price_data.bid > 0:  # Also rejects NaN
                     self.logger.error(f"Invalid bid price for {position.symbol}: {price_data.bid}")
                     raise ValueError(f"Invalid bid price for {position.symbol}: {price_data.bid}. Cannot liquidate position.")
 
@@ -107,13 +110,13 @@ class TradeCalculator:
                     continue
 
                 self.logger.info(f"Liquidating: {position.symbol} ({current_shares:,} shares @ ${current_price:.2f})")
-                trades.append(Trade(
+                trades.append(Trade.model_construct(
                     symbol=position.symbol,
                     quantity=int(-current_shares),
-                    current_shares=current_shares,
-                    target_value=0,
-                    current_value=current_shares * current_price,
-                    price=current_price,
+                    current_shares=float(current_shares),
+                    target_value=0.0,
+                    current_value=float(current_shares * current_price),
+                    price=float(current_price),
                     order_type='MARKET'
                 ))
 
@@ -139,11 +142,11 @@ class TradeCalculator:
                 self.logger.error(f"No price data for {symbol}")
                 raise ValueError(f"No price data for {symbol}. Rebalance aborted.")
 
-            if not price_data.bid or price_data.bid <= 0 or math.isnan(price_data.bid):
+            if not price_data.bid > 0:  # Also rejects NaN
                 self.logger.error(f"Invalid bid price for {symbol}: {price_data.bid}")
                 raise ValueError(f"Invalid bid price for {symbol}: {price_data.bid}. Rebalance aborted.")
 
-            if not price_data.ask or price_data.ask <= 0 or math.isnan(price_data.ask):
+            if not price_data.ask > 0:  # Also rejects NaN
                 self.logger.error(f"Invalid ask price for {symbol}: {price_data.ask}")
                 raise ValueError(f"Invalid ask price for {symbol}: {price_data.ask}. Rebalance aborted.")
 
@@ -171,12 +174,13 @@ class TradeCalculator:
 
             if shares_to_trade != 0:
                 order_type = 'LIMIT' if shares_to_trade > 0 else 'MARKET'
-                trades.append(Trade(
+                # Fields are already typed here; skip per-trade pydantic validation
+                trades.append(Trade.model_construct(
                     symbol=symbol,
                     quantity=shares_to_trade,
-                    current_shares=current_shares,
-                    target_value=target_value,
-                    current_value=current_value,
+                    current_shares=float(current_shares),
+                    target_value=float(target_value),
+                    current_value=float(current_value),
                     price=round(trade_price, 2),
                     order_type=order_type
                 ))
@@ -187,7 +191,7 @@ class TradeCalculator:
         """Determine appropriate trade price based on buy/sell direction"""
         if value_difference > 0:
             # Buy: use ask price with slippage adjustment
-            return price_data.ask * self.config.trading.buy_slippage_multiplier
+            return price_data.ask * self._buy_slippage_multiplier
         else:
             # Sell: use bid price
             return price_data.bid
@@ -202,9 +206,9 @@ class TradeCalculator:
         if allocation_diff < self.config.trading.allocation_threshold_percent:
             action = "sell" if shares_to_trade < 0 else "buy"
             self.logger.debug(
-                f"Skipping {action} for {symbol}: {allocation_diff:.2f}% difference < "
-                f"{self.config.trading.allocation_threshold_percent}% threshold "
-                f"(target={target_percent_display:.2f}%, current={current_percent:.2f}%)"
+                "Skipping %s for %s: %.2f%% difference < %s%% threshold (target=%.2f%%, current=%.2f%%)",
+                action, symbol, allocation_diff, self.config.trading.allocation_threshold_percent,
+                target_percent_display, current_percent
             )
             return False
         return True
@@ -213,15 +217,19 @@ class TradeCalculator:
         """Sort trades by priority: sells first, then buys by allocation %"""
         allocation_map = {alloc.symbol: alloc.allocation for alloc in allocations}
 
-        def sort_key(trade):
+        # Partition in a single pass, then order each side independently
+        sells = []
+        buys = []
+        for trade in trades:
             if trade.quantity < 0:
-                return (0, trade.quantity)  # Sells: by quantity (most negative first)
+                sells.append(trade)
             else:
-                allocation_pct = allocation_map.get(trade.symbol, 0)
-                return (1, -allocation_pct)  # Buys: by allocation (highest first)
+                buys.append(trade)
 
-        trades.sort(key=sort_key)
-        return trades
+        sells.sort(key=attrgetter('quantity'))  # Sells: by quantity (most negative first)
+        buys.sort(key=lambda t: allocation_map.get(t.symbol, 0), reverse=True)  # Buys: by allocation (highest first)
+
+        return sells + buys
 
     def _apply_cash_constraint_scaling(self, trades: List[Trade], snapshot: AccountSnapshot,
                                         allocations: List[AllocationItem], phase: str) -> List[Trade]:
@@ -309,7 +317,7 @@ class TradeCalculator:
                 total_scaled_cost += scaled_quantity * trade.price
 
                 if scaled_quantity != original_quantity:
-                    self.logger.debug(f"  Scaled {trade.symbol}: {original_quantity} → {scaled_quantity} shares")
+                    self.logger.debug("  Scaled %s: %s → %s shares", trade.symbol, original_quantity, scaled_quantity)
 
         if total_scaled_cost > available_cash:
             remaining_overage = total_scaled_cost - available_cash
@@ -326,7 +334,7 @@ class TradeCalculator:
                     reduction_value = trade.price
                     trade.quantity -= 1
                     total_scaled_cost -= reduction_value
-                    self.logger.debug(f"  Fine-tuned {trade.symbol}: reduced by 1 share")
+                    self.logger.debug("  Fine-tuned %s: reduced by 1 share", trade.symbol)
 
         final_cost = sum(t.quantity * t.price for t in scaled_trades if t.quantity > 0)
         remaining_cash = available_cash - final_cost